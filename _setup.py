@@ -1,15 +1,12 @@
 import subprocess
 import sys
 
-def install(package):
-    subprocess.check_call([sys.executable, "-m", "pip", "install", package])
+def install_requirements(requirements_file):
+    subprocess.check_call([sys.executable, "-m", "pip", "install", "-r", requirements_file])
 
 def main():
-    # Install required packages
-    with open('requirements.txt', 'r') as f:
-        packages = f.read().splitlines()
-        for package in packages:
-            install(package)
+    # Install required packages in a single pip run so dependencies are resolved once
+    install_requirements('requirements.txt')
     
     # Install Playwright browsers
     subprocess.check_call([sys.executable, "-m", "playwright", "install"])
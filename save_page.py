@@ -1,13 +1,22 @@
 import asyncio
-from playwright.async_api import async_playwright
+from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
+from collections import OrderedDict
+from contextlib import asynccontextmanager
 import os
 import base64
+import json
+import re
+import weakref
 from urllib.parse import urlparse, urljoin, unquote
-import aiofiles
+from pathlib import Path
+import blake3
+import httpx
+from diskcache import Cache
+from py3langid.langid import LanguageIdentifier, MODEL_FILE
 from tkr_utils.app_paths import AppPaths  # Import AppPaths
 from tkr_utils.helper_openai import OpenAIHelper  # Import OpenAIHelper
 import logging
-from bs4 import BeautifulSoup  # Import BeautifulSoup for HTML parsing
+from bs4 import BeautifulSoup, NavigableString, Tag  # Import BeautifulSoup for HTML parsing
 
 # Setup logging for this module
 logger = logging.getLogger(__name__)
@@ -16,8 +25,69 @@ logging.basicConfig(level=logging.INFO)
 # Initialize OpenAIHelper once
 openai_helper = OpenAIHelper(async_mode=True)
 
+# System prompt shared by every translation request. Keep it byte-identical across requests
+# (no per-request interpolation) so OpenAI's automatic prompt caching can reuse the prefix.
+TRANSLATION_SYSTEM_MESSAGE = "You are a website copy translator. Provide only the translation. Do not ask for clarity or offer suggestions. If a word doesn't appear to have a translation leave it as is."
+
+# Language detector used to skip text that is already Spanish. Short strings are easy to
+# misdetect, so only skip when the detector is confident.
+language_identifier = LanguageIdentifier.from_model_file(MODEL_FILE, norm_probs=True)
+SPANISH_DETECTION_THRESHOLD = 0.5
+
+# Tags whose text content is never shown on the page and must not be translated
+NON_TRANSLATABLE_TAGS = {'script', 'style', 'noscript', 'template'}
+
+# Persistent translation cache shared across runs, fronted by an in-process dict for hot strings
+AppPaths.add("_translation_cache")
+translation_cache = Cache(str(AppPaths._TRANSLATION_CACHE_DIR))
+translation_memory_cache = OrderedDict()  # LRU: most recently used entries at the end
+TRANSLATION_MEMORY_CACHE_SIZE = 10_000
+TRANSLATION_CACHE_EXPIRE = 7 * 86400  # seconds
+
+# Number of text snippets sent to OpenAI per translation request
+TRANSLATION_BATCH_SIZE = 50
+# Maximum number of translation requests in flight at once, across all pages being translated
+TRANSLATION_CONCURRENCY = 20
+# One semaphore per event loop, created on first use; asyncio primitives bind to a single loop
+translation_semaphores = weakref.WeakKeyDictionary()
+
+# Maximum time to wait for the load event after DOMContentLoaded, in milliseconds
+PAGE_LOAD_TIMEOUT = 10_000
+
+# Size of the chunks asset downloads are streamed to disk in, in bytes
+ASSET_CHUNK_SIZE = 64 * 1024
+
+# Requests the browser doesn't need to load while rendering a page for saving. Assets are
+# downloaded separately with httpx, which routing doesn't affect.
+BLOCKED_RESOURCE_TYPES = {'media', 'font'}
+BLOCKED_HOSTS = (
+    'google-analytics.com',
+    'googletagmanager.com',
+    'doubleclick.net',
+    'googlesyndication.com',
+    'facebook.net',
+    'connect.facebook.com',
+    'hotjar.com',
+    'segment.io',
+    'mixpanel.com',
+    'scorecardresearch.com',
+)
+
+# Attributes that reference downloadable assets, by tag; mirrors the asset extraction script
+ASSET_URL_ATTRIBUTES = {
+    'link': ('href',),
+    'script': ('src',),
+    'img': ('src', 'srcset'),
+    'source': ('src', 'srcset'),
+    'video': ('src', 'poster'),
+    'audio': ('src',),
+}
+
 def url_to_dirname(url: str) -> str:
-    """Convert a URL to a valid directory name.
+    """Convert a URL to a valid directory name, unique per URL.
+
+    The name is the host, a slug of the path and a short digest of the full URL, so
+    different pages on the same host never share a directory.
 
     Args:
         url (str): The URL to convert.
@@ -26,102 +96,478 @@ def url_to_dirname(url: str) -> str:
         str: The converted directory name.
     """
     parsed_url = urlparse(url)
-    return parsed_url.netloc.replace('www.', '').replace('.', '_')
+    host = parsed_url.netloc.replace('www.', '').replace('.', '_')
+    path_slug = re.sub(r'[^A-Za-z0-9]+', '_', parsed_url.path).strip('_')[:60]
+    url_digest = blake3.blake3(url.encode('utf-8')).hexdigest()[:8]
+    return '_'.join(part for part in (host, path_slug, url_digest) if part)
+
+
+def srcset_url_spans(srcset: str) -> list:
+    """Find the candidate URLs in a srcset attribute, following the HTML spec's parsing algorithm.
+
+    A URL runs to the next whitespace (so it may contain commas), a trailing comma ends the
+    candidate, and otherwise its descriptors run to the next comma outside parentheses.
+
+    Args:
+        srcset (str): The srcset attribute value.
+
+    Returns:
+        list: (start, end) offsets of each candidate URL within ``srcset``.
+    """
+    spans = []
+    pos = 0
+    while pos < len(srcset):
+        while pos < len(srcset) and (srcset[pos].isspace() or srcset[pos] == ','):
+            pos += 1
+        if pos >= len(srcset):
+            break
+        start = pos
+        while pos < len(srcset) and not srcset[pos].isspace():
+            pos += 1
+        end = pos
+        if srcset[start:end].endswith(','):
+            end = start + len(srcset[start:end].rstrip(','))
+        else:
+            depth = 0
+            while pos < len(srcset):
+                c = srcset[pos]
+                if c == '(':
+                    depth += 1
+                elif c == ')':
+                    depth = max(0, depth - 1)
+                elif c == ',' and depth == 0:
+                    break
+                pos += 1
+        if end > start:
+            spans.append((start, end))
+    return spans
+
+
+def rewrite_asset_urls(html_content: str, base_url: str, replacements: dict) -> str:
+    """Point asset attributes at their downloaded local copies.
+
+    Only whole attribute values (or whole srcset candidates) that resolve to a downloaded URL
+    are rewritten, so other links that merely contain an asset URL are left alone.
+
+    Args:
+        html_content (str): The page HTML.
+        base_url (str): The document base URL, used to resolve relative attribute values.
+        replacements (dict): Absolute asset URL -> local path.
+
+    Returns:
+        str: The HTML with asset references rewritten.
+    """
+    soup = BeautifulSoup(html_content, 'lxml')
+    for tag in soup.find_all(list(ASSET_URL_ATTRIBUTES)):
+        for attribute in ASSET_URL_ATTRIBUTES[tag.name]:
+            value = tag.get(attribute)
+            if not value:
+                continue
+            if attribute == 'srcset':
+                pieces = []
+                last = 0
+                for start, end in srcset_url_spans(value):
+                    local_path = replacements.get(urljoin(base_url, value[start:end]))
+                    if local_path:
+                        pieces += [value[last:start], local_path]
+                        last = end
+                pieces.append(value[last:])
+                tag[attribute] = ''.join(pieces)
+            else:
+                local_path = replacements.get(urljoin(base_url, value.strip()))
+                if local_path:
+                    tag[attribute] = local_path
+    return str(soup)
+
+
+def is_blocked_request(request) -> bool:
+    """Check whether a browser request is a blocked resource type or goes to a blocked host.
+
+    Args:
+        request (Request): The Playwright request to check.
+
+    Returns:
+        bool: True if the request should be aborted.
+    """
+    if request.resource_type in BLOCKED_RESOURCE_TYPES:
+        return True
+    hostname = urlparse(request.url).hostname or ''
+    return any(hostname == host or hostname.endswith(f'.{host}') for host in BLOCKED_HOSTS)
+
+
+async def block_unneeded_requests(route):
+    """Route handler that aborts blocked requests and lets everything else through."""
+    if is_blocked_request(route.request):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+class BrowserPool:
+    """
+    A pool of long-lived Chromium browsers that hands out fresh browser contexts.
+
+    Browsers are launched once and shared across pages; contexts are cheap and
+    isolate cookies and storage between pages. Each browser is relaunched after
+    serving max_contexts_per_browser contexts to keep its memory in check.
+
+    Usage:
+        async with BrowserPool() as pool:
+            async with pool.acquire() as context:
+                await save_page_with_assets(url, page_save_path, context)
+    """
+
+    def __init__(self, size: int = 2, max_contexts_per_browser: int = 100):
+        """
+        Args:
+            size (int): Number of browsers to run, and so the number of contexts in use at once.
+            max_contexts_per_browser (int): Contexts a browser serves before it is relaunched.
+        """
+        self.size = size
+        self.max_contexts_per_browser = max_contexts_per_browser
+        self._playwright = None
+        self._browsers = None  # Queue of (browser, contexts_served)
+
+    async def start(self):
+        """Start Playwright and launch the pool's browsers."""
+        self._playwright = await async_playwright().start()
+        self._browsers = asyncio.Queue()
+        try:
+            for _ in range(self.size):
+                browser = await self._playwright.chromium.launch()
+                self._browsers.put_nowait((browser, 0))
+        except BaseException:
+            # __aexit__ won't run if start() fails, so shut down what was started here
+            await self.close()
+            raise
+
+    async def close(self):
+        """Close all idle browsers and stop Playwright."""
+        while not self._browsers.empty():
+            browser, _ = self._browsers.get_nowait()
+            if browser is not None:
+                await browser.close()
+        await self._playwright.stop()
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    @asynccontextmanager
+    async def acquire(self):
+        """
+        Check out a browser and yield a new context on it, closing the context on exit.
+
+        Yields:
+            BrowserContext: A fresh browser context.
+        """
+        browser, served = await self._browsers.get()
+        try:
+            # Relaunch browsers that crashed, disconnected or have served their quota of contexts
+            if browser is None or not browser.is_connected() or served >= self.max_contexts_per_browser:
+                if browser is not None and browser.is_connected():
+                    await browser.close()
+                browser, served = None, 0
+                browser = await self._playwright.chromium.launch()
+
+            context = await browser.new_context()
+            served += 1
+            try:
+                yield context
+            finally:
+                await context.close()
+        finally:
+            self._browsers.put_nowait((browser, served))
 
 
-async def save_page_with_assets(url: str, page_save_path):
+async def save_page_with_assets(url: str, page_save_path, context):
     """
     Save a webpage along with its assets.
 
     Args:
         url (str): URL of the webpage to save.
         page_save_path (str): Path where the webpage and assets will be saved.
+        context (BrowserContext): Browser context to load the page in, e.g. from BrowserPool.acquire().
+
+    Returns:
+        str | None: The saved HTML content, or None if the page could not be loaded.
     """
     logger.info(f"Saving page: {url}")
 
     # Ensure save path exists
-    if not os.path.exists(page_save_path):
-        os.makedirs(page_save_path)
+    Path(page_save_path).mkdir(parents=True, exist_ok=True)
 
     error_log_path = os.path.join(page_save_path, 'errors.md')
-    
-    async with async_playwright() as p:
-        browser = await p.chromium.launch()
-        context = await browser.new_context()
-        page = await context.new_page()
+    errors = []  # Buffered errors.md entries, written once when the page is done
+
+    def log_error(error_message):
+        errors.append(error_message)
+        logger.error(error_message)
+
+    def flush_errors():
+        with open(error_log_path, 'a', encoding='utf-8') as f:
+            f.write(''.join(errors))
+
+    html_content = None
+    page = await context.new_page()
+    # Shared HTTP client for asset downloads; streams bodies and multiplexes requests over HTTP/2
+    asset_client = httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+        timeout=30,
+        follow_redirects=True,
+    )
 
+    try:
+        await context.route("**/*", block_unneeded_requests)
+        await page.goto(url, wait_until='domcontentloaded')
+        # Give the page a bounded chance to finish loading, but don't wait for the network to go idle
         try:
-            await page.goto(url, wait_until='networkidle')
-            logger.info(f"Page loaded: {url}")
-
-            html_content = await page.content()
-
-            # Extract and save all assets
-            urls = await page.evaluate('''() => {
-                const links = Array.from(document.querySelectorAll('link[rel="stylesheet"], script[src], img[src]'));
-                return links.map(link => link.href || link.src);
-            }''')
-
-            assets_dir = os.path.join(page_save_path, 'assets')
-            if not os.path.exists(assets_dir):
-                os.makedirs(assets_dir)
-
-            for asset_url in urls:
+            await page.wait_for_load_state('load', timeout=PAGE_LOAD_TIMEOUT)
+        except PlaywrightTimeoutError:
+            logger.warning(f"Page did not finish loading within {PAGE_LOAD_TIMEOUT} ms, continuing: {url}")
+        logger.info(f"Page loaded: {url}")
+
+        html_content = await page.content()
+
+        # Download assets with the same session and user agent the page was loaded with
+        for cookie in await context.cookies():
+            asset_client.cookies.set(cookie['name'], cookie['value'], domain=cookie['domain'], path=cookie['path'])
+        asset_client.headers['User-Agent'] = await page.evaluate('() => navigator.userAgent')
+
+        # Extract and save all assets, deduplicated in the page to keep the CDP payload small
+        urls = await page.evaluate('''() => {
+            // Candidate URLs from a srcset, following the HTML spec's parsing algorithm: a URL runs
+            // to the next whitespace (so it may contain commas), a trailing comma ends the candidate,
+            // and otherwise its descriptors run to the next comma outside parentheses.
+            const parseSrcset = (srcset) => {
+                const candidates = [];
+                let pos = 0;
+                while (pos < srcset.length) {
+                    while (pos < srcset.length && /[\\s,]/.test(srcset[pos])) pos++;
+                    if (pos >= srcset.length) break;
+                    let end = pos;
+                    while (end < srcset.length && !/\\s/.test(srcset[end])) end++;
+                    let candidateUrl = srcset.slice(pos, end);
+                    pos = end;
+                    if (candidateUrl.endsWith(',')) {
+                        candidateUrl = candidateUrl.replace(/,+$/, '');
+                    } else {
+                        let depth = 0;
+                        for (; pos < srcset.length; pos++) {
+                            const c = srcset[pos];
+                            if (c === '(') depth++;
+                            else if (c === ')') depth = Math.max(0, depth - 1);
+                            else if (c === ',' && depth === 0) break;
+                        }
+                    }
+                    if (candidateUrl) candidates.push(candidateUrl);
+                }
+                return candidates;
+            };
+
+            const urls = [];
+            const elements = document.querySelectorAll(
+                'link[rel="stylesheet"], script[src], img[src], img[srcset], source[src], source[srcset], video[src], video[poster], audio[src]'
+            );
+            for (const el of elements) {
+                const src = el.href || el.src;
+                if (src) urls.push(src);
+                if (el.poster) urls.push(el.poster);
+                const srcset = el.getAttribute('srcset');
+                if (srcset) {
+                    for (const candidateUrl of parseSrcset(srcset)) {
+                        // Inline srcset candidates are usually lazy-load placeholders, not real assets
+                        if (candidateUrl.startsWith('data:')) continue;
+                        try {
+                            urls.push(new URL(candidateUrl, document.baseURI).href);
+                        } catch (e) {
+                            // Ignore candidates that aren't valid URLs
+                        }
+                    }
+                }
+            }
+            return [...new Set(urls)];
+        }''')
+        # Resolve relative URLs, then dedupe in order so each URL is downloaded once
+        urls = list(dict.fromkeys(u if u.startswith('data:') else urljoin(url, u) for u in urls))
+
+        assets_dir = os.path.join(page_save_path, 'assets')
+        Path(assets_dir).mkdir(parents=True, exist_ok=True)
+
+        semaphore = asyncio.Semaphore(16)
+
+        async def fetch_one(asset_url):
+            """Download a single asset and return (asset_url, file_name) on success."""
+            async with semaphore:
                 try:
                     if asset_url.startswith('data:'):
                         # Handle data URLs
                         mime_type, data = asset_url.split(',', 1)
                         file_extension = mime_type.split(';')[0].split('/')[1]
-                        file_name = f"inline_asset_{hash(data)}.{file_extension}"
-                        file_path = os.path.join(assets_dir, file_name)
-                        
+
                         if 'base64' in mime_type:
-                            data = base64.b64decode(data)
+                            buffer = base64.b64decode(data)
                         else:
-                            data = unquote(data).encode('utf-8')
-                        
-                        async with aiofiles.open(file_path, 'wb') as f:
-                            await f.write(data)
+                            buffer = unquote(data).encode('utf-8')
+                        file_name = f"inline_asset_{blake3.blake3(buffer).hexdigest()[:16]}.{file_extension}"
+
+                        file_path = Path(assets_dir) / file_name
+                        await asyncio.to_thread(file_path.write_bytes, buffer)
                     else:
                         # Handle regular URLs
-                        asset_url = urljoin(url, asset_url)  # Handle relative URLs
-                        response = await page.goto(asset_url)
-                        if response:
-                            buffer = await response.body()
-                            parsed_url = urlparse(asset_url)
-                            file_name = os.path.basename(parsed_url.path) or f"asset_{hash(asset_url)}"
-                            file_path = os.path.join(assets_dir, file_name)
-
-                            async with aiofiles.open(file_path, 'wb') as f:
-                                await f.write(buffer)
+                        # Suffix the name with a digest of the full URL so distinct URLs sharing a
+                        # basename (different paths or query strings) never write to the same file
+                        url_digest = blake3.blake3(asset_url.encode('utf-8')).hexdigest()
+                        base_name = os.path.basename(urlparse(asset_url).path)
+                        if base_name:
+                            stem, suffix = os.path.splitext(base_name)
+                            file_name = f"{stem}_{url_digest[:8]}{suffix}"
                         else:
-                            raise Exception(f"Failed to fetch asset: {asset_url}")
-
-                    # Update HTML content to reference local asset files
-                    html_content = html_content.replace(asset_url, f'assets/{file_name}')
+                            file_name = f"asset_{url_digest[:16]}"
+                        file_path = Path(assets_dir) / file_name
+
+                        async with asset_client.stream('GET', asset_url) as response:
+                            if not response.is_success:
+                                raise Exception(f"Failed to fetch asset: {asset_url} (HTTP {response.status_code})")
+                            # Stream to disk so each in-flight asset holds at most one chunk in memory;
+                            # file I/O runs in a worker thread to keep it off the event loop
+                            f = await asyncio.to_thread(open, file_path, 'wb')
+                            try:
+                                async for chunk in response.aiter_bytes(ASSET_CHUNK_SIZE):
+                                    await asyncio.to_thread(f.write, chunk)
+                            except BaseException:
+                                await asyncio.to_thread(f.close)
+                                # Don't leave a truncated asset behind
+                                await asyncio.to_thread(file_path.unlink, missing_ok=True)
+                                raise
+                            await asyncio.to_thread(f.close)
+                    return asset_url, file_name
                 except Exception as e:
-                    error_message = f"Failed to download {asset_url}: {e}\n"
-                    async with aiofiles.open(error_log_path, 'a', encoding='utf-8') as f:
-                        await f.write(error_message)
-                    logger.error(error_message)
-
-            # Save the modified HTML content
-            html_file_path = os.path.join(page_save_path, 'webpage.html')
-            async with aiofiles.open(html_file_path, 'w', encoding='utf-8') as f:
-                await f.write(html_content)
-            logger.info(f"HTML content saved: {html_file_path}")
-
-        except Exception as e:
-            error_message = f"Failed to save page {url}: {e}\n"
-            async with aiofiles.open(error_log_path, 'a', encoding='utf-8') as f:
-                await f.write(error_message)
-            logger.error(error_message)
-        finally:
-            await browser.close()
+                    log_error(f"Failed to download {asset_url}: {e}\n")
+                    return None
 
-        return html_content
+        results = await asyncio.gather(*[fetch_one(u) for u in urls], return_exceptions=True)
+
+        # Update HTML content to reference local asset files
+        replacements = {
+            asset_url: f'assets/{file_name}'
+            for asset_url, file_name in (result for result in results if isinstance(result, tuple))
+        }
+        if replacements:
+            base_url = await page.evaluate('() => document.baseURI')
+            html_content = rewrite_asset_urls(html_content, base_url, replacements)
+
+        # Save the modified HTML content
+        html_file_path = Path(page_save_path) / 'webpage.html'
+        await asyncio.to_thread(html_file_path.write_text, html_content, encoding='utf-8')
+        logger.info(f"HTML content saved: {html_file_path}")
+
+    except Exception as e:
+        log_error(f"Failed to save page {url}: {e}\n")
+    finally:
+        await page.close()
+        await asset_client.aclose()
+        if errors:
+            await asyncio.to_thread(flush_errors)
+
+    return html_content
     
 
+def translation_cache_key(text: str, content_type: str = None) -> str:
+    """
+    Build the cache key for a translation request.
+
+    Args:
+        text (str): The text being translated.
+        content_type (str, optional): The type of content being translated.
+
+    Returns:
+        str: A hex digest identifying the prompt and text.
+    """
+    key_source = f"{TRANSLATION_SYSTEM_MESSAGE}\0{content_type or ''}\0{text}"
+    return blake3.blake3(key_source.encode('utf-8')).hexdigest()
+
+def remember_translation(key: str, translated: str):
+    """
+    Store a translation in the in-memory LRU, evicting the least recently used entry when full.
+
+    Args:
+        key (str): The translation cache key.
+        translated (str): The translated text.
+    """
+    translation_memory_cache[key] = translated
+    translation_memory_cache.move_to_end(key)
+    if len(translation_memory_cache) > TRANSLATION_MEMORY_CACHE_SIZE:
+        translation_memory_cache.popitem(last=False)
+
+def get_cached_translation(text: str, content_type: str = None):
+    """
+    Look up a translation in the in-memory cache, then the on-disk cache.
+
+    Args:
+        text (str): The text being translated.
+        content_type (str, optional): The type of content being translated.
+
+    Returns:
+        str | None: The cached translation, or None on a miss.
+    """
+    key = translation_cache_key(text, content_type)
+    if key in translation_memory_cache:
+        translation_memory_cache.move_to_end(key)
+        return translation_memory_cache[key]
+    translated = translation_cache.get(key)
+    if translated is not None:
+        remember_translation(key, translated)
+    return translated
+
+def set_cached_translation(text: str, content_type: str, translated: str):
+    """
+    Store a translation in both cache tiers.
+
+    Args:
+        text (str): The text that was translated.
+        content_type (str): The type of content that was translated.
+        translated (str): The translation returned by OpenAI.
+    """
+    key = translation_cache_key(text, content_type)
+    remember_translation(key, translated)
+    translation_cache.set(key, translated, expire=TRANSLATION_CACHE_EXPIRE)
+
+def needs_translation(text: str) -> bool:
+    """
+    Cheaply decide whether a string is worth sending to OpenAI.
+
+    Strings without letters (numbers, prices, punctuation), single characters and
+    text that is confidently detected as Spanish already are left untranslated.
+
+    Args:
+        text (str): The stripped text to check.
+
+    Returns:
+        bool: True if the text should be translated.
+    """
+    if len(text) < 2 or not any(c.isalpha() for c in text):
+        return False
+    language, probability = language_identifier.classify(text)
+    return not (language == 'es' and probability >= SPANISH_DETECTION_THRESHOLD)
+
+def get_translation_semaphore() -> asyncio.Semaphore:
+    """
+    Get the semaphore limiting translation requests on the running event loop.
+
+    Returns:
+        asyncio.Semaphore: The semaphore shared by every caller on this loop.
+    """
+    loop = asyncio.get_running_loop()
+    semaphore = translation_semaphores.get(loop)
+    if semaphore is None:
+        semaphore = translation_semaphores[loop] = asyncio.Semaphore(TRANSLATION_CONCURRENCY)
+    return semaphore
+
 async def send_text_to_openai(text: str, content_type: str = None) -> str:
     """
     Send the text content to OpenAI for processing.
@@ -131,63 +577,138 @@ async def send_text_to_openai(text: str, content_type: str = None) -> str:
         content_type (str, optional): The type of content being translated.
 
     Returns:
-        str: The response from OpenAI.
+        str: The response from OpenAI, or the original text if the request failed.
     """
     try:
-        system_message = "You are a website copy translator. Provide only the translation. Do not ask for clarity or offer suggestions. If a word doesn't appear to have a translation leave it as is."
-        
+        cached = get_cached_translation(text, content_type)
+        if cached is not None:
+            return cached
+
+        # Per-request details go in the user message so the system prompt stays a cacheable prefix
+        user_message = f"Translate the following text to Spanish: {text}"
         if content_type:
-            system_message += f" You are currently translating {content_type} content."
+            user_message = f"You are currently translating {content_type} content. {user_message}"
 
         messages = [
-            {"role": "system", "content": system_message},
-            {"role": "user", "content": f"Translate the following text to Spanish: {text}"}
+            {"role": "system", "content": TRANSLATION_SYSTEM_MESSAGE},
+            {"role": "user", "content": user_message}
         ]
         response = await openai_helper.send_message_async(messages)
-        return response.choices[0].message.content
+        translated = response.choices[0].message.content
+        set_cached_translation(text, content_type, translated)
+        return translated
     except Exception as e:
-        logger.error(f"Error sending text to OpenAI: {e}")
-        return str(e)
+        logger.error(f"Error sending text to OpenAI, keeping original text: {e}")
+        return text
 
-async def translate_html_content(html_content: str) -> str:
+async def send_batch_to_openai(items: list) -> list:
     """
-    Translate the text content of the HTML to Spanish, including meta tags and img alt attributes.
+    Send a batch of texts to OpenAI in a single request.
 
     Args:
-        html_content (str): The HTML content to translate.
+        items (list): (text, content_type) pairs to translate.
 
     Returns:
-        str: The translated HTML content.
+        list: The translated texts, in the same order as ``items``.
     """
+    payload = [{"id": i, "type": content_type, "text": text} for i, (text, content_type) in enumerate(items)]
+
+    messages = [
+        {"role": "system", "content": TRANSLATION_SYSTEM_MESSAGE},
+        {"role": "user", "content": (
+            "Translate the \"text\" of each item in the following JSON list to Spanish. "
+            "The \"type\" field describes where the text appears on the page. "
+            "Return only a JSON array of the translated strings, in the same order.\n"
+            f"{json.dumps(payload, ensure_ascii=False)}\n"
+            f"The array must contain exactly {len(items)} strings."
+        )}
+    ]
     try:
-        soup = BeautifulSoup(html_content, 'html.parser')
-        
-        # Translate meta tags
-        for meta in soup.find_all('meta', attrs={'name': ['description', 'keywords']}):
-            if 'content' in meta.attrs:
-                original_content = meta['content']
-                translated_content = await send_text_to_openai(original_content, content_type="meta tag")
-                meta['content'] = translated_content
+        response = await openai_helper.send_message_async(messages)
+        reply = response.choices[0].message.content.strip()
+    except Exception as e:
+        # Retrying item by item would just repeat a transport or rate-limit failure 50 times,
+        # so leave the batch untranslated instead
+        logger.error(f"Error sending batch to OpenAI, keeping original text: {e}")
+        return [text for text, _ in items]
 
-        # Translate img alt attributes
-        for img in soup.find_all('img', alt=True):
-            original_alt = img['alt']
-            if original_alt.strip():
-                translated_alt = await send_text_to_openai(original_alt, content_type="image alt text")
-                img['alt'] = translated_alt
-
-        # Translate visible text content
-        for element in soup.find_all(text=True):
-            if element.parent.name not in ['script', 'style', 'head', 'meta', '[document]']:
-                if element.string and element.string.strip():
-                    content_type = f"{element.parent.name} element"
-                    translated_text = await send_text_to_openai(element.string, content_type=content_type)
-                    element.string.replace_with(translated_text)
+    try:
+        # Models sometimes wrap JSON in a markdown code fence
+        if reply.startswith('```'):
+            reply = reply.strip('`').removeprefix('json').strip()
+
+        translations = json.loads(reply)
+        if isinstance(translations, list) and len(translations) == len(items):
+            translations = [str(t) for t in translations]
+            for (text, content_type), translated in zip(items, translations):
+                set_cached_translation(text, content_type, translated)
+            return translations
+        logger.warning(f"Batch translation returned a malformed reply, expected a JSON array of {len(items)} strings")
+    except json.JSONDecodeError as e:
+        logger.warning(f"Batch translation reply is not valid JSON: {e}")
+
+    # The model answered but not in the requested shape; translate the batch one item at a time
+    return [await send_text_to_openai(text, content_type=content_type) for text, content_type in items]
+
+async def translate_texts(items: list) -> list:
+    """
+    Translate (text, content_type) pairs in concurrent batches of TRANSLATION_BATCH_SIZE.
+    Surrounding whitespace is preserved but not sent, each distinct pair is translated
+    once, and pairs that need no translation or are already in the translation cache
+    are not sent to OpenAI.
 
-        return str(soup)
-    except Exception as e:
-        logger.error(f"Error translating HTML content: {e}")
-        return html_content
+    Args:
+        items (list): (text, content_type) pairs to translate.
+
+    Returns:
+        list: The translated texts, in the same order as ``items``.
+    """
+    async def translate_batch(batch):
+        async with get_translation_semaphore():
+            return await send_batch_to_openai(batch)
+
+    # Deduplicate on the stripped text and content type so repeated strings are translated once
+    unique = {(text.strip(), content_type): None for text, content_type in items}
+    for key in unique:
+        text, content_type = key
+        # Strings that need no translation are kept as-is without a cache or API round-trip
+        unique[key] = get_cached_translation(*key) if needs_translation(text) else text
+    pending = [key for key, translated in unique.items() if translated is None]
+
+    batches = [pending[i:i + TRANSLATION_BATCH_SIZE] for i in range(0, len(pending), TRANSLATION_BATCH_SIZE)]
+    results = await asyncio.gather(*[translate_batch(batch) for batch in batches])
+    for key, translated in zip(pending, [translated for batch_result in results for translated in batch_result]):
+        unique[key] = translated
+
+    translations = []
+    for text, content_type in items:
+        stripped = text.strip()
+        leading = text[:len(text) - len(text.lstrip())]
+        trailing = text[len(text.rstrip()):]
+        translations.append(f"{leading}{unique[(stripped, content_type)]}{trailing}")
+    return translations
+
+def iter_translatable_strings(soup):
+    """
+    Yield the non-blank text nodes of the soup in document order, without descending
+    into subtrees whose text is never shown (scripts, styles, etc.).
+
+    Args:
+        soup (BeautifulSoup): The parsed HTML document.
+
+    Yields:
+        NavigableString: Each translatable text node.
+    """
+    stack = [soup]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, Tag):
+            if node.name not in NON_TRANSLATABLE_TAGS:
+                # Push children in reverse so they are popped in document order
+                stack.extend(reversed(node.contents))
+        elif type(node) is NavigableString and node.strip():
+            # Exact type check skips comments, doctypes and CDATA sections
+            yield node
 
 async def translate_html_content(html_content: str) -> str:
     """
@@ -200,28 +721,30 @@ async def translate_html_content(html_content: str) -> str:
         str: The translated HTML content.
     """
     try:
-        soup = BeautifulSoup(html_content, 'html.parser')
-        
-        # Translate meta tags
+        soup = BeautifulSoup(html_content, 'lxml')
+
+        # Collect everything to translate first, then apply the results in a second pass.
+        # Content types are kept coarse (meta / alt / page text) so repeated strings share one
+        # translation and cache entry regardless of which tag they appear in.
+        targets = []  # (apply_translation, text, content_type)
+
+        # Meta tags
         for meta in soup.find_all('meta', attrs={'name': ['description', 'keywords']}):
             if 'content' in meta.attrs:
-                original_content = meta['content']
-                translated_content = await send_text_to_openai(original_content, content_type="meta")
-                meta['content'] = translated_content
+                targets.append((lambda t, meta=meta: meta.__setitem__('content', t), meta['content'], "meta tag"))
 
-        # Translate img alt attributes
+        # Img alt attributes
         for img in soup.find_all('img', alt=True):
-            original_alt = img['alt']
-            if original_alt.strip():
-                translated_alt = await send_text_to_openai(original_alt, content_type="img")
-                img['alt'] = translated_alt
-
-        # Translate visible text content
-        for element in soup.find_all(text=True):
-            if element.parent.name not in ['script', 'style', 'head', 'meta', '[document]']:
-                if element.string and element.string.strip():
-                    translated_text = await send_text_to_openai(element.string, content_type="element")
-                    element.string.replace_with(translated_text)
+            if img['alt'].strip():
+                targets.append((lambda t, img=img: img.__setitem__('alt', t), img['alt'], "image alt text"))
+
+        # Visible text content
+        for element in iter_translatable_strings(soup):
+            targets.append((element.replace_with, str(element), "page text"))
+
+        translations = await translate_texts([(text, content_type) for _, text, content_type in targets])
+        for (apply_translation, _, _), translated in zip(targets, translations):
+            apply_translation(translated)
 
         return str(soup)
     except Exception as e:
@@ -230,9 +753,8 @@ async def translate_html_content(html_content: str) -> str:
 
 async def translate_page(html_content, site_save_path):
     translated_html_content = await translate_html_content(html_content)
-    translated_html_file_path = os.path.join(site_save_path, 'webpage_translated.html')
-    async with aiofiles.open(translated_html_file_path, 'w', encoding='utf-8') as f:
-        await f.write(translated_html_content)
+    translated_html_file_path = Path(site_save_path) / 'webpage_translated.html'
+    await asyncio.to_thread(translated_html_file_path.write_text, translated_html_content, encoding='utf-8')
     logger.info(f"Translated HTML content saved: {translated_html_file_path}")
 
 def save_dir_info(url):
@@ -241,14 +763,34 @@ def save_dir_info(url):
     return page_save_path
     
 
+async def save_and_translate(urls):
+    """
+    Save and translate each URL, sharing one browser pool across all pages.
+
+    Args:
+        urls (list): URLs of the webpages to process.
+    """
+    async with BrowserPool() as pool:
+        async def process(url):
+            # Isolate failures so one bad URL doesn't abort the rest of the batch
+            try:
+                page_save_path = save_dir_info(url)
+                async with pool.acquire() as context:
+                    html_content = await save_page_with_assets(url, page_save_path, context)
+                if html_content is None:
+                    logger.error(f"Skipping translation, page was not saved: {url}")
+                    return
+                await translate_page(html_content, page_save_path)
+            except Exception as e:
+                logger.error(f"Failed to process {url}: {e}")
+
+        # Identical URLs would map to the same save directory, so process each only once
+        await asyncio.gather(*[process(url) for url in dict.fromkeys(urls)])
+
 # Add the downloads directory using AppPaths
 AppPaths.add("_downloaded_pages")
 
 
 # Example usage
 url = 'https://www.example.com'
-page_save_path = save_dir_info(url)
-
-html_content = asyncio.run(save_page_with_assets(url, page_save_path))
-
-asyncio.run(translate_page(html_content, page_save_path))
\ No newline at end of file
+asyncio.run(save_and_translate([url]))
\ No newline at end of file